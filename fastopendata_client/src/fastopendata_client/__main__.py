@@ -0,0 +1,3 @@
+from fastopendata_client.cli_entry import cli_entry
+
+cli_entry()
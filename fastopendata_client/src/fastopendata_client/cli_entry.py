@@ -1,23 +1,99 @@
-import json
+from __future__ import annotations
+
+import getopt
+import io
 import logging
 import os
 import re
 import sys
-from typing import Optional
 
-import click
-import rich
-from pyfiglet import Figlet
-from rich.console import Group
-from rich.panel import Panel
-from rich.syntax import Syntax
+from fastopendata_client.client import (
+    BATCH_SIZE,
+    CONCURRENCY,
+    FastOpenData,
+    FastOpenDataClientException,
+    FastOpenDataConnectionException,
+    FastOpenDataRateLimitException,
+    dumps_json,
+)
+
+logger = logging.getLogger(__name__)
+
+EMAIL_REGEX = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b")
+
+
+NO_API_KEY_ERROR = (
+    "You need to specify an API key using the option "
+    '"--api-key" or export your API key to the environment '
+    'variable "FASTOPENDATA_API_KEY".'
+    "\n"
+    "\n"
+    "To get a free API key for evaluation purposes and simple "
+    "use-cases, try the command: "
+    "\n"
+    "\n"
+    "fastopendata get-api-key"
+    "\n"
+).encode("utf-8")
+TOO_MANY_ADDRESSES_ERROR = (
+    "You can use either `--free-form-query` or the structured address "
+    "parameters, but not both.\n"
+).encode("utf-8")
+NO_ADDRESS_ERROR = (
+    'You must specify an address. Use "fastopendata --help" for options.\n'
+).encode("utf-8")
+NO_DATA_ERROR = "No data found for the address.\n".encode("utf-8")
+
+
+def error(message: bytes) -> None:
+    """
+    Write an error message directly to the binary stderr stream.
+    """
+    sys.stderr.buffer.write(message)
+    sys.stderr.buffer.flush()
+
 
-from fastopendata_client.client import FastOpenData, FastOpenDataConnectionException
+def write_stdout(output: bytes) -> None:
+    """
+    Write `output` to file descriptor 1 with `os.write`, bypassing the
+    Python-level buffering of `sys.stdout`. If `sys.stdout` isn't backed by
+    a file descriptor (as under click's `CliRunner`, or when redirected in
+    process), it is written to `sys.stdout.buffer` instead.
+    """
+    sys.stdout.flush()
+    try:
+        fileno = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.flush()
+        return
+    view = memoryview(output)
+    while view:
+        view = view[os.write(fileno, view):]
 
-logging.basicConfig(level=logging.INFO)
 
-FIGLET = Figlet(font="slant")
-BANNER = FIGLET.renderText("FastOpenData")
+def int_option(name: str, value, default: int) -> int:
+    """
+    Convert the value of the integer option `--name`, exiting with a usage
+    error like `click` does if it isn't a positive integer.
+    """
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        error(
+            f"Error: Invalid value for '--{name}': {value!r} is not a valid "
+            f"integer.\n\n{CSV_USAGE}".encode("utf-8")
+        )
+        sys.exit(2)
+    if number < 1:
+        error(
+            f"Error: Invalid value for '--{name}': {number} is not in the "
+            f"range x>=1.\n\n{CSV_USAGE}".encode("utf-8")
+        )
+        sys.exit(2)
+    return number
 
 
 def check_api_key(api_key):
@@ -27,139 +103,108 @@ def check_api_key(api_key):
     """
     api_key = api_key or os.environ.get("FASTOPENDATA_API_KEY", None)
     if not api_key:
-        print(
-            "You need to specify an API key using the option "
-            '"--api-key" or export your API key to the environment '
-            'variable "FASTOPENDATA_API_KEY".'
-            "\n"
-            "\n"
-            "To get a free API key for evaluation purposes and simple "
-            "use-cases, try the command: "
-            "\n"
-            "\n"
-            "fastopendata get-api-key"
-        )
+        error(NO_API_KEY_ERROR)
         sys.exit(1)
     return api_key
 
 
-@click.group()
-def cli_entry():
-    """
-    This is the command-line tool for FastOpenData. \n
-    
-    Use it to get an API key, retrieve data for a single address,
-    or append data to an existing CSV file.
-
-    """
-
-
-@cli_entry.command()
-@click.option(
-    "--free-form-query", default=None, help="unstructured United States address"
-)
-@click.option("--address1", default=None, help="street address line one")
-@click.option("--address2", default=None, help="street address line two")
-@click.option("--city", default=None, help="city")
-@click.option("--state", default=None, help="state")
-@click.option("--zip-code", default=None, help="zip code")
-@click.option("--api-key", default=None, help="API key")
-@click.option("--no-pretty-print", is_flag=True, default=False, help="Suppress pretty-printing the JSON response")
-def get(
-    free_form_query: Optional[str], 
-    address1: Optional[str], 
-    address2: Optional[str], 
-    city: Optional[str], 
-    state: Optional[str], 
-    zip_code: Optional[str], 
-    api_key: Optional[str], 
-    no_pretty_print: Optional[bool]
+def _do_get(
+    free_form_query: str | None = None,
+    address1: str | None = None,
+    address2: str | None = None,
+    city: str | None = None,
+    state: str | None = None,
+    zip_code: str | None = None,
+    api_key: str | None = None,
+    no_pretty_print: bool | None = False,
 ):
     """Get a single data payload for one address."""
     api_key = check_api_key(api_key)
 
-    def _unstructured_address_provided():
-        return bool(free_form_query)
-
-    def _structured_address_provided():
-        return bool(address1) and bool(city) and bool(state) and bool(zip_code)
+    unstructured_address_provided = bool(free_form_query)
+    structured_address_provided = all((address1, city, state, zip_code))
 
-    def _too_many_addresses_provided():
-        return _unstructured_address_provided() and _structured_address_provided()
-
-    if _too_many_addresses_provided():
-        print(
-            "You can use either `--free-form-query` or the structured address "
-            "parameters, but not both."
-        )
+    if unstructured_address_provided and structured_address_provided:
+        error(TOO_MANY_ADDRESSES_ERROR)
         sys.exit(1)
-    if not _unstructured_address_provided() and not _structured_address_provided():
-        print('You must specify an address. Use "fastopendata --help" for options.')
+    if not (unstructured_address_provided or structured_address_provided):
+        error(NO_ADDRESS_ERROR)
         sys.exit(1)
-    logging.debug(f"fastopendata got query: {free_form_query}")
-    client = FastOpenData(api_key=api_key)
-    data = client.request(free_form_query=free_form_query)
+    logger.debug("fastopendata got query: %s", free_form_query)
+    with FastOpenData(api_key=api_key) as client:
+        try:
+            data = client.request(free_form_query=free_form_query)
+        except (FastOpenDataClientException, FastOpenDataRateLimitException) as e:
+            error(f"Error: {e}\n".encode("utf-8"))
+            sys.exit(1)
     if not data:
-        print("No data found for the address.")
+        error(NO_DATA_ERROR)
         sys.exit(1)
     if no_pretty_print:
-        print(json.dumps(data))
+        write_stdout(dumps_json(data) + b"\n")
     else:
+        import rich
+
         rich.print(data)
 
 
-@cli_entry.command()
-@click.option("--api-key", default=None, help="API key")
-@click.option("--input-csv", default=None, help="input CSV file with addresses")
-@click.option("--output-csv", default=None, help="target CSV with appended data")
-@click.option(
-    "--free-form-query", default=None, help="unstructured United States address"
-)
-@click.option("--address1", default=None, help="street address line one")
-@click.option("--address2", default=None, help="street address line two")
-@click.option("--city", default=None, help="city")
-@click.option("--state", default=None, help="state")
-@click.option("--zip-code", default=None, help="zip code")
-@click.option("--api-key", default=None, help="API key")
-def csv(
-    api_key: str,
-    input_csv: str,
-    output_csv: str,
-    free_form_query,
-    address1,
-    address2,
-    city,
-    state,
-    zip_code,
+def _do_csv(
+    api_key: str | None = None,
+    input_csv: str | None = None,
+    output_csv: str | None = None,
+    free_form_query: str | None = None,
+    address1: str | None = None,
+    address2: str | None = None,
+    city: str | None = None,
+    state: str | None = None,
+    zip_code: str | None = None,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
 ):
     """
     Append data from FastOpenData to an existing CSV file.
     """
     api_key = check_api_key(api_key)
+    batch_size = int_option("batch-size", batch_size, BATCH_SIZE)
+    concurrency = int_option("concurrency", concurrency, CONCURRENCY)
 
-    client = FastOpenData(api_key=api_key)
-    client.append_to_csv(
-        input_csv=input_csv,
-        output_csv=output_csv,
-        free_form_query_column=free_form_query,
-        address1_column=address1,
-        address2_column=address2,
-        city_column=city,
-        state_column=state,
-        zip_code_column=zip_code,
-    )
+    # `append_to_csv` checks the CSV parameters before doing any work.
+    with FastOpenData(api_key=api_key) as client:
+        try:
+            client.append_to_csv(
+                input_csv=input_csv,
+                output_csv=output_csv,
+                free_form_query_column=free_form_query,
+                address1_column=address1,
+                address2_column=address2,
+                city_column=city,
+                state_column=state,
+                zip_code_column=zip_code,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
+        except (FastOpenDataClientException, FastOpenDataRateLimitException) as e:
+            error(f"Error: {e}\n".encode("utf-8"))
+            sys.exit(1)
 
 
-@cli_entry.command()
-def get_api_key():
+def _do_get_api_key(email_address: str | None = None):
     """
     Get a free API key for FastOpenData.
     """
-    email_address = click.prompt("Enter your email address")
-    email_regex = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b"
+    # `rich` is only needed here and in the pretty-printed `get` output, so
+    # it is imported lazily to keep it off the startup path.
+    import rich
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+    from rich.text import Text
 
-    if not re.fullmatch(email_regex, email_address):
-        print(f"Email {email_address} is not valid.")
+    if email_address is None:
+        email_address = input("Enter your email address: ")
+
+    if not EMAIL_REGEX.fullmatch(email_address):
+        error(f"Email {email_address} is not valid.\n".encode("utf-8"))
         return
 
     try:
@@ -193,19 +238,17 @@ fastopendata get --api-key="{api_key}" \\
 """.format(
             api_key=api_key
         )
-        msg_1 = """
-Your API key is:\n
-[bold]{api_key}[/bold]\n
-To test your client using the command-line tool, try:
-""".format(
-            api_key=api_key
+        msg_1 = Text.assemble(
+            "\nYour API key is:\n\n",
+            (api_key, "bold"),
+            "\n\nTo test your client using the command-line tool, try:\n",
         )
 
-        msg_2 = """If you want to try writing some Python code:"""
+        msg_2 = Text("If you want to try writing some Python code:")
 
         msg_3 = """If you don't want to keep entering your API key, you can set an environment variable `FASTOPENDATA_API_KEY`."""
 
-        msg_4 = """For API documentation, visit <https://fastopendata.com>"""
+        msg_4 = Text("For API documentation, visit <https://fastopendata.com>")
 
         group = Group(
             msg_1,
@@ -215,12 +258,206 @@ To test your client using the command-line tool, try:
             # msg_3,
             msg_4,
         )
-        rich.print(Panel(group, title="[green]Success!", subtitle=None))
+        rich.print(Panel(group, title=Text("Success!", style="green"), subtitle=None))
     if response_dict["status"] == "EXPIRE_OLD_KEY":
         rich.print(
             "[red]Note: This email address already had an API key. The old one will be expired.[/red]"
         )
 
 
+USAGE = """Usage: fastopendata COMMAND [OPTIONS]
+
+  This is the command-line tool for FastOpenData.
+
+  Use it to get an API key, retrieve data for a single address,
+  or append data to an existing CSV file.
+
+Commands:
+  csv          Append data from FastOpenData to an existing CSV file.
+  get          Get a single data payload for one address.
+  get-api-key  Get a free API key for FastOpenData.
+"""
+
+GET_USAGE = """Usage: fastopendata get [OPTIONS]
+
+  Get a single data payload for one address.
+
+Options:
+  --free-form-query TEXT  unstructured United States address
+  --address1 TEXT         street address line one
+  --address2 TEXT         street address line two
+  --city TEXT             city
+  --state TEXT            state
+  --zip-code TEXT         zip code
+  --api-key TEXT          API key
+  --no-pretty-print       Suppress pretty-printing the JSON response
+"""
+
+CSV_USAGE = """Usage: fastopendata csv [OPTIONS]
+
+  Append data from FastOpenData to an existing CSV file.
+
+Options:
+  --api-key TEXT          API key
+  --input-csv TEXT        input CSV file with addresses
+  --output-csv TEXT       target CSV with appended data
+  --free-form-query TEXT  unstructured United States address
+  --address1 TEXT         street address line one
+  --address2 TEXT         street address line two
+  --city TEXT             city
+  --state TEXT            state
+  --zip-code TEXT         zip code
+  --batch-size INTEGER    number of rows sent to the server per request
+  --concurrency INTEGER   number of requests to the server in flight at once
+"""
+
+GET_API_KEY_USAGE = """Usage: fastopendata get-api-key
+
+  Get a free API key for FastOpenData.
+"""
+
+ADDRESS_OPTIONS = [
+    "free-form-query=",
+    "address1=",
+    "address2=",
+    "city=",
+    "state=",
+    "zip-code=",
+    "api-key=",
+]
+
+# Maps each subcommand to its handler, its long options for `getopt` and
+# its help text. Boolean flags are the options without a trailing "=".
+COMMANDS = {
+    "get": (_do_get, ADDRESS_OPTIONS + ["no-pretty-print"], GET_USAGE),
+    "csv": (_do_csv, ADDRESS_OPTIONS + ["input-csv=", "output-csv=", "batch-size=", "concurrency="], CSV_USAGE),
+    "get-api-key": (_do_get_api_key, [], GET_API_KEY_USAGE),
+}
+COMMANDS["get_api_key"] = COMMANDS["get-api-key"]
+
+
+def _fast_main(argv):
+    """
+    Dispatch `argv` to the matching subcommand using `getopt`, which
+    avoids building a `click` parser on every invocation.
+    """
+    if not argv or argv[0] in ("-h", "--help"):
+        print(USAGE)
+        sys.exit(0 if argv else 2)
+    command = argv[0]
+    if command not in COMMANDS:
+        error(f"Error: No such command '{command}'.\n\n{USAGE}".encode("utf-8"))
+        sys.exit(2)
+    function, long_options, usage = COMMANDS[command]
+    try:
+        options, arguments = getopt.gnu_getopt(
+            argv[1:], "h", long_options + ["help"]
+        )
+    except getopt.GetoptError as e:
+        error(f"Error: {e}\n\n{usage}".encode("utf-8"))
+        sys.exit(2)
+    if arguments:
+        error(
+            f"Error: Got unexpected extra argument ({' '.join(arguments)})\n\n"
+            f"{usage}".encode("utf-8")
+        )
+        sys.exit(2)
+    kwargs = {}
+    for option, value in options:
+        if option in ("-h", "--help"):
+            print(usage)
+            sys.exit(0)
+        name = option[2:]
+        kwargs[name.replace("-", "_")] = value if f"{name}=" in long_options else True
+    function(**kwargs)
+
+
+def _click_cli():
+    """
+    Build the original `click` command group. This is only used when the
+    `FASTOPENDATA_USE_CLICK` environment variable is set.
+    """
+    import click
+
+    @click.group()
+    def cli():
+        """
+        This is the command-line tool for FastOpenData. \n
+
+        Use it to get an API key, retrieve data for a single address,
+        or append data to an existing CSV file.
+
+        """
+
+    @cli.command()
+    @click.option(
+        "--free-form-query", default=None, help="unstructured United States address"
+    )
+    @click.option("--address1", default=None, help="street address line one")
+    @click.option("--address2", default=None, help="street address line two")
+    @click.option("--city", default=None, help="city")
+    @click.option("--state", default=None, help="state")
+    @click.option("--zip-code", default=None, help="zip code")
+    @click.option("--api-key", default=None, help="API key")
+    @click.option("--no-pretty-print", is_flag=True, default=False, help="Suppress pretty-printing the JSON response")
+    def get(**kwargs):
+        """Get a single data payload for one address."""
+        _do_get(**kwargs)
+
+    @cli.command()
+    @click.option("--api-key", default=None, help="API key")
+    @click.option("--input-csv", default=None, help="input CSV file with addresses")
+    @click.option("--output-csv", default=None, help="target CSV with appended data")
+    @click.option(
+        "--free-form-query", default=None, help="unstructured United States address"
+    )
+    @click.option("--address1", default=None, help="street address line one")
+    @click.option("--address2", default=None, help="street address line two")
+    @click.option("--city", default=None, help="city")
+    @click.option("--state", default=None, help="state")
+    @click.option("--zip-code", default=None, help="zip code")
+    @click.option(
+        "--batch-size",
+        default=BATCH_SIZE,
+        type=click.IntRange(min=1),
+        help="number of rows sent to the server per request",
+    )
+    @click.option(
+        "--concurrency",
+        default=CONCURRENCY,
+        type=click.IntRange(min=1),
+        help="number of requests to the server in flight at once",
+    )
+    def csv(**kwargs):
+        """
+        Append data from FastOpenData to an existing CSV file.
+        """
+        _do_csv(**kwargs)
+
+    @cli.command()
+    def get_api_key():
+        """
+        Get a free API key for FastOpenData.
+        """
+        _do_get_api_key(email_address=click.prompt("Enter your email address"))
+
+    return cli
+
+
+def cli_entry():
+    """
+    This is the command-line tool for FastOpenData.
+
+    Use it to get an API key, retrieve data for a single address,
+    or append data to an existing CSV file.
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO)
+    if os.environ.get("FASTOPENDATA_USE_CLICK"):
+        _click_cli()()
+    else:
+        _fast_main(sys.argv[1:])
+
+
 if __name__ == "__main__":
     cli_entry()
@@ -27,6 +27,12 @@ The main class for this client is `FastOpenData` which is invoked like so:
 
 `data` now contains a dictionary with all the data from the FastOpenData server.
 
+The client keeps its connections to the server open between requests. To make
+sure they are closed when you're done, use it as a context manager:
+
+>>> with FastOpenData(api_key="<YOUR_API_KEY>") as session:
+...     data = session.request(free_form_query="123 Main Street, Tallahassee, FL, 12345")
+
 If you have a Pandas dataframe, you can append new columns containing data from
 FastOpenData by calling `FastOpenData.append_to_dataframe` and specifying which
 columns contain address information. For example, if `COLUMN_NAME` contains
@@ -56,27 +62,182 @@ Note that you have the option of specifying either `free_form_query` or the colu
 names for structured address data, but not both. Doing so will raise an exception.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
 import pathlib
+import random
+import shelve
 import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from csv import DictReader, DictWriter
-from typing import Dict, List, Optional
-
+from csv import reader as csv_reader
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode
+
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from rich.progress import Progress
-import toml
+from urllib3.util.retry import Retry
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-logging.basicConfig(level=logging.INFO)
+try:
+    import h2  # noqa: F401
+
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 SCRIPT_PATH = list(pathlib.Path(__file__).parts[:-1]) + ["config.toml"]
 SCRIPT_PATH = pathlib.Path(*SCRIPT_PATH)
-CONFIG = toml.load(SCRIPT_PATH)
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> dict:
+    """
+    Load the client configuration from `config.toml`, using the stdlib
+    `tomllib` parser where it is available (Python 3.11+).
+    """
+    if tomllib is not None:
+        with open(SCRIPT_PATH, "rb") as f:
+            return tomllib.load(f)
+    import toml
+
+    return toml.load(SCRIPT_PATH)
+
+
+CONFIG = load_config()
 BATCH_SIZE = CONFIG["client"]["batch_size"]
+BATCH_BYTES = CONFIG["client"]["batch_bytes"]
+CONCURRENCY = CONFIG["client"]["concurrency"]
 IP_ADDRESS = CONFIG["server"]["ip_address"]
 PORT = CONFIG["server"]["port"]
 SCHEME = CONFIG["server"]["scheme"]
+CSV_BUFFER_SIZE = 1 << 20
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+RETRY_TOTAL = 8
+RETRY_CONNECT = 1
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_JITTER = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RESPONSE_ERROR_DETAILS = frozenset(
+    {
+        "GeographyException",
+        "AuthorizationException",
+        "IncompleteDataException",
+        "NominatimQueryException",
+    }
+)
+
+
+def _json_safe(value):
+    """
+    Convert `value` for the stdlib `json` module the way `orjson` serializes
+    it: numpy scalars and arrays become Python values, and NaN and infinite
+    floats become `None`.
+    """
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, (np.generic, np.ndarray)):
+        return _json_safe(value.tolist())
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def dumps_json(data) -> bytes:
+    """
+    Serialize `data` to compact JSON bytes, using `orjson` if it is
+    installed. The stdlib fallback uses the same separators and handles
+    numpy values and NaN as `orjson` does, so both produce the same bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        _json_safe(data), separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
+def loads_json(content: bytes):
+    """
+    Parse a JSON response body, using `orjson` if it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def retry_policy() -> Retry:
+    """
+    The retry policy for HTTP requests to the FastOpenData server: retry
+    rate-limited and transient server errors with jittered exponential
+    backoff, honoring any `Retry-After` header. The last response is
+    returned rather than raised once the retries are used up.
+
+    Connection and read errors are only retried `RETRY_CONNECT` times, so
+    that an unreachable server fails quickly instead of backing off for
+    minutes.
+    """
+    return Retry(
+        total=RETRY_TOTAL,
+        connect=RETRY_CONNECT,
+        read=RETRY_CONNECT,
+        status=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_jitter=RETRY_BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    How long to wait before retry number `attempt` (counting from zero),
+    using the same backoff as `retry_policy`.
+    """
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return RETRY_BACKOFF_FACTOR * (2**attempt) + random.uniform(
+        0, RETRY_BACKOFF_JITTER
+    )
 
 
 class FastOpenDataSecurityException(Exception):
@@ -126,6 +287,7 @@ class FastOpenData:
         port: int = PORT,
         scheme: str = SCHEME,
         api_key: str = None,
+        cache_path: Optional[str] = None,
     ) -> None:
         self.api_key = api_key or os.environ.get("FASTOPENDATA_API_KEY", None)
         self.ip_address = ip_address
@@ -144,32 +306,211 @@ class FastOpenData:
             "Content-type": "application/json",
             "x-api-key": self.api_key,
         }
+        # A single session keeps connections to the server alive across
+        # requests, so batches don't each pay for a new TCP/TLS handshake.
+        self.session = requests.Session()
+        self.session.headers.update(self.request_headers)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry_policy(),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Responses from `request` are optionally stored on disk, keyed by
+        # the normalized query, so that repeated runs over the same
+        # addresses don't go back to the server. `cache` is set before the
+        # shelf is opened so that `close` still works if opening it fails.
+        self.cache = None
+        self.cache_lock = threading.Lock()
+        if cache_path:
+            self.cache = shelve.open(cache_path)
+
+    def close(self) -> None:
+        """
+        Close the connections held by the client's session, and the
+        response cache if there is one.
+        """
+        self.session.close()
+        if getattr(self, "cache", None) is not None:
+            self.cache.close()
+            self.cache = None
+
+    @staticmethod
+    def cache_key(**query: Optional[str]) -> str:
+        """
+        Build the response cache key for a query. Fields are normalized for
+        case and whitespace, so trivially different spellings of the same
+        address share an entry.
+        """
+        canonical_query = "|".join(
+            f"{field}={' '.join(str(value).split()).lower()}"
+            for field, value in sorted(query.items())
+            if value
+        )
+        return hashlib.blake2b(
+            canonical_query.encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    def __enter__(self) -> "FastOpenData":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # `__init__` may have raised before the session was created.
+        if getattr(self, "session", None) is not None:
+            self.close()
+
+    @staticmethod
+    def is_blank_query(*fields) -> bool:
+        """
+        Return True if none of the address fields has any content, i.e.
+        each is missing (None, NaN or `pd.NA`), or only whitespace. Such
+        queries can't match anything, so they are answered locally with
+        `empty_query_response`.
+        """
+        return all(
+            (pd.api.types.is_scalar(field) and pd.isna(field))
+            or not str(field).strip()
+            for field in fields
+        )
 
     @staticmethod
-    def flatten_response_dict(response_dict: dict) -> dict:
+    def empty_query_response() -> dict:
+        """
+        The response returned, without calling the server, for a blank
+        query.
+        """
+        return {
+            "success": False,
+            "detail": "EmptyQuery",
+        }
+
+    @staticmethod
+    def check_address_columns(
+        columns: Iterable[Optional[str]], available: Iterable[str], source: str
+    ) -> bool:
+        """
+        Check that every address column that was named is in `available`.
+
+        Args:
+            columns: The address column names, with `None` for columns that
+                weren't named.
+            available: The columns that are present.
+            source: What the columns were looked for in, for the error
+                message.
+
+        Returns:
+            True if all the named columns are present.
+
+        Raises:
+            FastOpenDataClientException: If a named column is missing.
+        """
+        available = set(available)
+        missing = [
+            column
+            for column in columns
+            if column is not None and column not in available
+        ]
+        if missing:
+            raise FastOpenDataClientException(
+                f"Address column(s) {', '.join(f'`{column}`' for column in missing)} "
+                f"not found in the {source}."
+            )
+        return True
+
+    @staticmethod
+    def flatten_response_dict(
+        response_dict: dict,
+        column_names: Optional[Dict[str, Tuple[tuple, tuple]]] = None,
+    ) -> dict:
         """
         Flatten the keys for the `response_dict` so that
         the values can be appended to the DataFrame.
+
+        `column_names` maps each geography to the attributes last seen for
+        it and their flattened column names. Sharing it between calls means
+        that when a geography has the same attributes as before, its values
+        are copied in one `dict.update` without rebuilding any names.
         """
+        if column_names is None:
+            column_names = {}
         flat_response_dict = {}
         for geography, subdict in response_dict.items():
-            if not subdict:
+            # Skip empty geographies and non-geography entries such as the
+            # `success` and `detail` of an error response.
+            if not subdict or not isinstance(subdict, dict):
                 continue
-            for attribute, value in subdict.items():
-                column_name = ".".join([geography, attribute])
-                flat_response_dict[column_name] = value
+            flat_response_dict.update(
+                zip(
+                    FastOpenData.geography_column_names(
+                        geography, subdict, column_names
+                    ),
+                    subdict.values(),
+                )
+            )
         return flat_response_dict
 
+    @staticmethod
+    def geography_column_names(
+        geography: str,
+        subdict: dict,
+        column_names: Dict[str, Tuple[tuple, tuple]],
+    ) -> tuple:
+        """
+        Return the flattened column names for the attributes in `subdict`,
+        reusing the names cached in `column_names` when the geography has
+        the same attributes as the last time it was seen.
+        """
+        attributes = tuple(subdict)
+        schema = column_names.get(geography)
+        if schema is None or schema[0] != attributes:
+            schema = (
+                attributes,
+                tuple(f"{geography}.{attribute}" for attribute in attributes),
+            )
+            column_names[geography] = schema
+        return schema[1]
+
     @staticmethod
     def flatten_response_list(response_list: List[dict]) -> List[dict]:
         """
         Flatten a list of response dictionaries.
         """
+        column_names: Dict[str, Tuple[tuple, tuple]] = {}
         return [
-            FastOpenData.flatten_response_dict(response_dict)
+            FastOpenData.flatten_response_dict(response_dict, column_names)
             for response_dict in response_list
         ]
 
+    @staticmethod
+    def flatten_response_columns(response_list: List[dict]) -> Dict[str, list]:
+        """
+        Flatten a list of response dictionaries into a dictionary of
+        columns, so that pandas can build the DataFrame directly instead of
+        pivoting one dictionary per row. Missing values are `None`.
+        """
+        row_count = len(response_list)
+        columns: Dict[str, list] = {}
+        column_names: Dict[str, Tuple[tuple, tuple]] = {}
+        for index, response_dict in enumerate(response_list):
+            for geography, subdict in response_dict.items():
+                if not subdict or not isinstance(subdict, dict):
+                    continue
+                for column_name, value in zip(
+                    FastOpenData.geography_column_names(
+                        geography, subdict, column_names
+                    ),
+                    subdict.values(),
+                ):
+                    column = columns.get(column_name)
+                    if column is None:
+                        column = columns[column_name] = [None] * row_count
+                    column[index] = value
+        return columns
+
     @classmethod
     def get_free_api_key(cls, email_address: str) -> str:
         """
@@ -186,11 +527,13 @@ class FastOpenData:
             "Content-type": "application/json",
         }
         try:
-            response = requests.get(
-                free_api_key_url,
-                params={"email_address": email_address},
-                headers=headers,
-            )
+            with requests.Session() as session:
+                session.mount(free_api_key_url, HTTPAdapter(max_retries=retry_policy()))
+                response = session.get(
+                    free_api_key_url,
+                    params={"email_address": email_address},
+                    headers=headers,
+                )
         except Exception as e:
             raise FastOpenDataConnectionException(
                 f"Problem connecting to the FastOpenData server. {e}"
@@ -199,7 +542,7 @@ class FastOpenData:
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             raise e
-        response_dict = response.json()
+        response_dict = loads_json(response.content)
         return response_dict
 
     @staticmethod
@@ -228,12 +571,13 @@ class FastOpenData:
         Raises:
             FastOpenDataClientException: If the request parameters are invalid.
         '''
-        if not (free_form_query or city or state or address1 or zip_code):
+        structured_query = city or state or address1 or address2 or zip_code
+        if not (free_form_query or structured_query):
             raise FastOpenDataClientException(
                 "Must include either `free_form_query` or some combination of "
                 "`city`, `state`, `address` and `zip_code` when making a request."
             )
-        if free_form_query and (city or state or address1 or address2 or zip_code):
+        if free_form_query and structured_query:
             raise FastOpenDataClientException(
                 "Request included both `free_form_query` and `city`, `state`, "
                 "`address`, or `zip_code`, which is not permitted. Choose either "
@@ -241,19 +585,20 @@ class FastOpenData:
             )
         return True
 
-    @property
+    @functools.cached_property
     def api_spec(self) -> dict:
         """
         Get the API specification from the FastOpenData server. We do this because
         the API specification is subject to change and we want to make sure that
-        the client is always in sync with the server.
+        the client is always in sync with the server. The specification is
+        fetched once per client instance.
         """
         api_spec_url = f"{self.url}/openapi.json"
-        response = requests.get(api_spec_url)
+        response = self.session.get(api_spec_url)
         response.raise_for_status()
-        return response.json()
+        return loads_json(response.content)
 
-    @property
+    @functools.cached_property
     def geography_columns_dict(self) -> dict:
         """
         Get the geography columns from the API specification.
@@ -271,7 +616,7 @@ class FastOpenData:
             geography_columns_dict[key] = properties
         return geography_columns_dict
 
-    @property
+    @functools.cached_property
     def geography_columns_list(self) -> List[str]:
         """
         Get the geography columns from the API specification as a list.
@@ -289,6 +634,7 @@ class FastOpenData:
         address1: Optional[str] = None,
         address2: Optional[str] = None,
         zip_code: Optional[str] = None,
+        use_cache: bool = True,
     ) -> dict:
         """
         Make a request for a single address from the FastOpenData service.
@@ -300,6 +646,8 @@ class FastOpenData:
             address1: The address line 1.
             address2: The address line 2.
             zip_code: The zip code.
+            use_cache: Whether to use the response cache, if the client was
+                created with a `cache_path`.
 
         Returns:
             A dictionary containing the response data.
@@ -315,32 +663,98 @@ class FastOpenData:
             address2=address2,
             zip_code=zip_code,
         )
-        response = requests.get(
+        if FastOpenData.is_blank_query(
+            free_form_query, city, state, address1, address2, zip_code
+        ):
+            return FastOpenData.empty_query_response()
+        key = None
+        if use_cache and self.cache is not None:
+            key = FastOpenData.cache_key(
+                free_form_query=free_form_query,
+                city=city,
+                state=state,
+                address1=address1,
+                address2=address2,
+                zip_code=zip_code,
+            )
+            with self.cache_lock:
+                cached_response = self.cache.get(key)
+            if cached_response is not None:
+                return cached_response
+        response = self.session.get(
             self.get_single_address_url,
             params={
                 "free_form_query": free_form_query,
             },
-            headers=self.request_headers,
         )
-        FastOpenData.check_response(response)
-        return response.json()
+        json_output = FastOpenData.read_response(response)
+        if key is not None and response.ok and "detail" not in json_output:
+            with self.cache_lock:
+                self.cache[key] = json_output
+        return json_output
 
     @classmethod
-    def check_response(cls, response: requests.Response) -> dict:
+    def read_response(
+        cls, response: Union[requests.Response, "httpx.Response"]
+    ) -> Union[dict, list]:
         """
-        Check that the response from the FastOpenData server is valid.
+        Check the response from the FastOpenData server and return its
+        JSON body, which is only parsed once.
+
+        Errors for single rows of a batch are part of its result, and are
+        returned along with the other rows.
+
+        Raises:
+            FastOpenDataRateLimitException: If the server rate limited the
+                client.
+            FastOpenDataClientException: If the server returned an error for
+                the whole request, or a response that isn't JSON.
         """
         try:
-            response.json()
-        except Exception as _:
-            return {
-                "success": False,
-                "detail": "ServerError",
-            }
+            json_output = loads_json(response.content)
+        except ValueError:
+            json_output = None
+        response_test = cls.check_response(response, json_output=json_output)
+        if response_test is True:
+            return json_output
+        detail = response_test["detail"]
+        if detail == "RateLimitException":
+            raise FastOpenDataRateLimitException(
+                "The FastOpenData server rate limited the client. Try again later."
+            )
+        if isinstance(json_output, list):
+            return json_output
+        raise FastOpenDataClientException(
+            f"The FastOpenData server returned an error: {detail}"
+        )
 
+    @classmethod
+    def check_response(
+        cls,
+        response: Union[requests.Response, "httpx.Response"],
+        json_output: Optional[Union[dict, list]] = None,
+    ) -> dict:
+        """
+        Check that the response from the FastOpenData server is valid.
+        Pass `json_output` if the response body has already been parsed.
+        """
+        if json_output is None:
+            try:
+                json_output = loads_json(response.content)
+            except Exception as _:
+                return {
+                    "success": False,
+                    "detail": "ServerError",
+                }
+
+        http_errors = (requests.exceptions.RequestException,)
+        # httpx is only imported by `send_chunks_async`, so a response can
+        # only come from it once it has been loaded.
+        if "httpx" in sys.modules:
+            http_errors += (sys.modules["httpx"].HTTPStatusError,)
         try:
             response.raise_for_status()
-        except requests.exceptions.RequestException as e:
+        except http_errors as e:
             # This works differently from the other exceptions because we use
             # the fastapi-limit library to rate limit the client.
             if e.response.status_code == 429:
@@ -350,37 +764,22 @@ class FastOpenData:
                 }
             raise e
 
-        def _test_single_response(response_dict: Dict) -> bool:
-            if response_dict.get("detail", None) == "GeographyException":
-                return {
-                    "success": False,
-                    "detail": "GeographyException",
-                }
-            elif response_dict.get("detail", None) == "AuthorizationException":
-                return {
-                    "success": False,
-                    "detail": "AuthorizationException",
-                }
-            elif response_dict.get("detail", None) == "IncompleteDataException":
-                return {
-                    "success": False,
-                    "detail": "IncompleteDataException",
-                }
-            elif response_dict.get("detail", None) == "NominatimQueryException":
+        def _test_single_response(response_dict: Dict) -> Union[bool, dict]:
+            detail = response_dict.get("detail", None)
+            if detail in RESPONSE_ERROR_DETAILS:
                 return {
                     "success": False,
-                    "detail": "NominatimQueryException",
+                    "detail": detail,
                 }
             return True
 
-        json_output = response.json()
+        if isinstance(json_output, dict):
+            return _test_single_response(json_output)
         if isinstance(json_output, list):
             for response_dict in json_output:
                 response_test = _test_single_response(response_dict)
-                if not response_test:
+                if response_test is not True:
                     return response_test
-            else:
-                pass
         return True
 
     def append_to_dataframe(
@@ -414,24 +813,91 @@ class FastOpenData:
         Raises:
             FastOpenDataClientException: If the `free_form_query` and
                 `structured_query` arguments are both specified, or neither
-                is specified, or if the DataFrame is empty.
+                is specified, or if the DataFrame is empty, or if a column
+                named with something other than its default name isn't in
+                the DataFrame.
         """
-        df_dict = df.to_dict(orient="records")
+        # Columns left at their default names are optional and are dropped
+        # if the DataFrame doesn't have them; any other name must exist.
+        named_columns = {
+            field: None if column == field and column not in df.columns else column
+            for field, column in {
+                "free_form_query": free_form_query_column,
+                "address1": address1_column,
+                "address2": address2_column,
+                "city": city_column,
+                "state": state_column,
+                "zip_code": zip_code_column,
+            }.items()
+        }
+        FastOpenData.check_address_columns(
+            named_columns.values(), df.columns, "DataFrame"
+        )
+        # Only the address columns are needed by the server, so build the
+        # records from those alone instead of converting every column.
+        address_columns = [
+            column for column in named_columns.values() if column is not None
+        ]
+        if not address_columns:
+            raise FastOpenDataClientException(
+                "The DataFrame has none of the address columns."
+            )
+        # `Series.tolist` converts each column to Python objects in one
+        # pass, which is cheaper than iterating the rows of a sub-frame.
+        # `send_batch` only sends each distinct address once.
+        df_dict = [
+            dict(zip(address_columns, row))
+            for row in zip(*(df[column].tolist() for column in address_columns))
+        ]
         batch_response = self.send_batch(
             df_dict,
-            free_form_query_column=free_form_query_column,
-            address1_column=address1_column,
-            address2_column=address2_column,
-            city_column=city_column,
-            state_column=state_column,
-            zip_code_column=zip_code_column,
+            free_form_query_column=named_columns["free_form_query"],
+            address1_column=named_columns["address1"],
+            address2_column=named_columns["address2"],
+            city_column=named_columns["city"],
+            state_column=named_columns["state"],
+            zip_code_column=named_columns["zip_code"],
             batch_size=batch_size,
         )
-        batch_response = FastOpenData.flatten_response_list(batch_response)
-        df_response = pd.DataFrame(batch_response)
-        df_combined = pd.concat([df, df_response], axis=1)
+        columns = FastOpenData.flatten_response_columns(batch_response)
+        # Build the responses on the DataFrame's own index so that the
+        # concatenation lines up row-for-row even when `df` does not have a
+        # default RangeIndex. With `copy=False` the result reuses the blocks
+        # of both frames rather than copying them into new ones.
+        df_response = pd.DataFrame(columns, index=df.index)
+        df_combined = pd.concat([df, df_response], axis=1, copy=False)
         return df_combined
 
+    def batch_address_url(
+        self,
+        free_form_query_column: Optional[str] = None,
+        address1_column: Optional[str] = None,
+        address2_column: Optional[str] = None,
+        city_column: Optional[str] = None,
+        state_column: Optional[str] = None,
+        zip_code_column: Optional[str] = None,
+    ) -> str:
+        """
+        Build the batch endpoint URL with the column names already encoded
+        in its query string, so that they are encoded once per batch rather
+        than once per request.
+        """
+        params = {
+            key: value
+            for key, value in {
+                "free_form_query_column": free_form_query_column,
+                "address1_column": address1_column,
+                "address2_column": address2_column,
+                "city_column": city_column,
+                "state_column": state_column,
+                "zip_code_column": zip_code_column,
+            }.items()
+            if value is not None
+        }
+        if not params:
+            return self.get_batch_address_url
+        return f"{self.get_batch_address_url}?{urlencode(params)}"
+
     def send_batch(
         self,
         batch: List[Dict],
@@ -443,45 +909,233 @@ class FastOpenData:
         zip_code_column: Optional[str] = None,
         batch_size: Optional[int] = BATCH_SIZE,
         progress_bar: Optional[bool] = True,
+        concurrency: Optional[int] = CONCURRENCY,
+        use_cache: bool = True,
+        batch_bytes: Optional[int] = BATCH_BYTES,
     ) -> List[Dict]:
         """
         Rename keys to match `free_form_query`, etc. Then send the
         list of dictionaries to the batch endpoint.
+
+        Every column that is named must be present in every row; otherwise
+        `FastOpenDataClientException` is raised.
+
+        The batch goes through these steps:
+
+        1. Rows with identical values in the named address columns are
+           reduced to one (`_unique_rows`).
+        2. Rows whose named address columns are all blank are answered
+           with `empty_query_response` instead of being sent.
+        3. If the client has a response cache and address columns are
+           named, rows whose address is already cached are answered from it.
+        4. The remaining rows are posted (`_post_chunks`), in requests of at
+           most `batch_size` rows and roughly `batch_bytes` bytes each.
+
+        The responses are then copied back to every row of `batch`.
         """
-        total_response: List[dict] = []
-        total_batch_size = len(batch)
-        if progress_bar:
-            pbar = Progress(transient=True, expand=False)
-            task = pbar.add_task("Sending batch", total=total_batch_size)
-        while batch:
-            sub_batch = batch[:batch_size]
-            batch = batch[batch_size:]
-
-            response = requests.post(
-                self.get_batch_address_url,
-                json={
-                    "batch": sub_batch,
-                },
-                params={
-                    "free_form_query_column": free_form_query_column,
-                    "address1_column": address1_column,
-                    "address2_column": address2_column,
-                    "city_column": city_column,
-                    "state_column": state_column,
-                    "zip_code_column": zip_code_column,
-                },
-                headers=self.request_headers,
+        address_columns = {
+            "free_form_query": free_form_query_column,
+            "address1": address1_column,
+            "address2": address2_column,
+            "city": city_column,
+            "state": state_column,
+            "zip_code": zip_code_column,
+        }
+        # Columns that weren't named are left for the server to resolve, so
+        # only the named ones are checked, tested for blank values and used
+        # to find duplicate rows.
+        named_columns = tuple(
+            column for column in address_columns.values() if column is not None
+        )
+        FastOpenData.check_address_columns(
+            named_columns,
+            (
+                column
+                for column in named_columns
+                if all(column in row for row in batch)
+            ),
+            "batch",
+        )
+        if named_columns:
+            unique_batch, positions = FastOpenData._unique_rows(batch, named_columns)
+        else:
+            # Without any named columns there is no telling which keys hold
+            # the address, so every row is sent as it is.
+            unique_batch, positions = batch, []
+        responses: List[Optional[Dict]] = [
+            FastOpenData.empty_query_response()
+            if named_columns
+            and FastOpenData.is_blank_query(*(row[column] for column in named_columns))
+            else None
+            for row in unique_batch
+        ]
+        cache_keys: Dict[int, str] = {}
+        if use_cache and self.cache is not None and named_columns:
+            cache_keys = {
+                index: FastOpenData.cache_key(
+                    **{
+                        field: unique_batch[index].get(column)
+                        for field, column in address_columns.items()
+                    }
+                )
+                for index, response in enumerate(responses)
+                if response is None
+            }
+            with self.cache_lock:
+                for index, key in cache_keys.items():
+                    responses[index] = self.cache.get(key)
+        missing = [
+            index for index, response in enumerate(responses) if response is None
+        ]
+        if missing:
+            missing_responses = self._post_chunks(
+                self.batch_address_url(
+                    free_form_query_column=free_form_query_column,
+                    address1_column=address1_column,
+                    address2_column=address2_column,
+                    city_column=city_column,
+                    state_column=state_column,
+                    zip_code_column=zip_code_column,
+                ),
+                [unique_batch[index] for index in missing],
+                batch_size=batch_size,
+                batch_bytes=batch_bytes,
+                concurrency=concurrency,
+                progress_bar=progress_bar,
             )
-            FastOpenData.check_response(response)
-            total_response += response.json()
-            if progress_bar:
-                pbar.advance(task, len(sub_batch))
+            for index, response in zip(missing, missing_responses):
+                responses[index] = response
+            if cache_keys:
+                with self.cache_lock:
+                    for index in missing:
+                        if "detail" not in responses[index]:
+                            self.cache[cache_keys[index]] = responses[index]
+        if len(unique_batch) == len(batch):
+            return responses
+        # Copy so that callers can safely modify each row's response.
+        return [dict(responses[position]) for position in positions]
+
+    @staticmethod
+    def _unique_rows(
+        batch: List[Dict], columns: Tuple[str, ...]
+    ) -> Tuple[List[Dict], List[int]]:
+        """
+        Return the rows of `batch` with distinct values in `columns`, and the
+        position in that list of each row of `batch`.
+        """
+        unique_positions: Dict[tuple, int] = {}
+        unique_batch: List[Dict] = []
+        positions: List[int] = []
+        for row in batch:
+            key = tuple(row.get(column) for column in columns)
+            position = unique_positions.get(key)
+            if position is None:
+                position = unique_positions[key] = len(unique_batch)
+                unique_batch.append(row)
+            positions.append(position)
+        return unique_batch, positions
+
+    def _post_chunks(
+        self,
+        batch_address_url: str,
+        batch: List[Dict],
+        batch_size: Optional[int] = BATCH_SIZE,
+        batch_bytes: Optional[int] = BATCH_BYTES,
+        concurrency: Optional[int] = CONCURRENCY,
+        progress_bar: Optional[bool] = True,
+    ) -> List[Dict]:
+        """
+        Post `batch` to the batch endpoint in the requests made by
+        `chunk_batch` and return the responses in order.
+
+        If there is more than one request, they are sent concurrently with
+        `send_chunks_async`. If an event loop is already running in this
+        thread (as in Jupyter), a thread pool is used instead, since
+        `asyncio.run` can't be nested.
+        """
+        chunks = list(
+            FastOpenData.chunk_batch(
+                batch, batch_size=batch_size, batch_bytes=batch_bytes
+            )
+        )
+
+        def _post(chunk: Tuple[int, bytes]) -> List[Dict]:
+            response = self.session.post(batch_address_url, data=chunk[1])
+            return FastOpenData.read_response(response)
+
+        total_response: List[dict] = []
+        # The bar is advanced once per request rather than per row, and only
+        # redrawn twice a second.
+        with Progress(
+            transient=True,
+            expand=False,
+            refresh_per_second=2,
+            disable=not progress_bar,
+        ) as pbar:
+            task = pbar.add_task("Sending batch", total=len(batch))
+            if len(chunks) > 1 and concurrency > 1:
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    return asyncio.run(
+                        self.send_chunks_async(
+                            batch_address_url,
+                            chunks,
+                            concurrency=concurrency,
+                            on_response=functools.partial(pbar.advance, task),
+                        )
+                    )
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    for chunk, response in zip(chunks, executor.map(_post, chunks)):
+                        total_response.extend(response)
+                        pbar.advance(task, chunk[0])
+                return total_response
+            for chunk in chunks:
+                total_response.extend(_post(chunk))
+                pbar.advance(task, chunk[0])
         return total_response
 
-    def append_to_csv(
+    @staticmethod
+    def chunk_batch(
+        batch: List[Dict],
+        batch_size: Optional[int] = BATCH_SIZE,
+        batch_bytes: Optional[int] = BATCH_BYTES,
+    ) -> Iterator[Tuple[int, bytes]]:
+        """
+        Split a batch into request bodies for the batch endpoint.
+
+        A new body is started whenever adding the next row would take the
+        current one past `batch_size` rows or `batch_bytes` bytes of
+        serialized rows, so that rows of very different sizes still give
+        requests of about the same size. A single row larger than
+        `batch_bytes` is sent on its own.
+
+        Args:
+            batch: The rows to send.
+            batch_size: The maximum number of rows in each body.
+            batch_bytes: The target size of each body, in bytes.
+
+        Returns:
+            An iterator of `(number of rows, body)` tuples.
+        """
+        rows: List[bytes] = []
+        size = 0
+        for row in batch:
+            row_bytes = dumps_json(row)
+            if rows and (
+                len(rows) >= batch_size or size + len(row_bytes) > batch_bytes
+            ):
+                yield len(rows), b'{"batch":[' + b",".join(rows) + b"]}"
+                rows = []
+                size = 0
+            rows.append(row_bytes)
+            size += len(row_bytes)
+        if rows:
+            yield len(rows), b'{"batch":[' + b",".join(rows) + b"]}"
+
+    async def send_batch_async(
         self,
-        input_csv: str = "",
-        output_csv: str = "",
+        batch: List[Dict],
         free_form_query_column: Optional[str] = None,
         address1_column: Optional[str] = None,
         address2_column: Optional[str] = None,
@@ -489,31 +1143,231 @@ class FastOpenData:
         state_column: Optional[str] = None,
         zip_code_column: Optional[str] = None,
         batch_size: Optional[int] = BATCH_SIZE,
-    ):
+        concurrency: Optional[int] = CONCURRENCY,
+        batch_bytes: Optional[int] = BATCH_BYTES,
+    ) -> List[Dict]:
         """
-        Append data from FastOpenData to an existing CSV file.
+        Send the list of dictionaries to the batch endpoint in chunks made
+        by `chunk_batch`, with at most `concurrency` requests in flight. The
+        responses are returned in the same order as `batch`.
+        """
+        batch_address_url = self.batch_address_url(
+            free_form_query_column=free_form_query_column,
+            address1_column=address1_column,
+            address2_column=address2_column,
+            city_column=city_column,
+            state_column=state_column,
+            zip_code_column=zip_code_column,
+        )
+        chunks = FastOpenData.chunk_batch(
+            batch, batch_size=batch_size, batch_bytes=batch_bytes
+        )
+        return await self.send_chunks_async(
+            batch_address_url, chunks, concurrency=concurrency
+        )
+
+    async def send_chunks_async(
+        self,
+        batch_address_url: str,
+        chunks: Iterable[Tuple[int, bytes]],
+        concurrency: Optional[int] = CONCURRENCY,
+        on_response: Optional[Callable[[int], object]] = None,
+    ) -> List[Dict]:
+        """
+        Post request bodies from `chunk_batch` to the batch endpoint, with
+        at most `concurrency` requests in flight, and return the responses
+        in order.
+
+        If `on_response` is given, it is called with the number of rows in
+        each request as soon as that request's response has been read, for
+        example to advance a progress bar.
+        """
+        # httpx is only needed here, and importing it at module level would
+        # also load click, rich and pygments on every CLI call.
+        import httpx
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        # With HTTP/2 every request is multiplexed over a single connection.
+        # The limits and HTTP version are set on the transport, because
+        # httpx ignores the client's own settings once a transport is given.
+        async with httpx.AsyncClient(
+            headers=self.request_headers,
+            timeout=None,
+            transport=httpx.AsyncHTTPTransport(
+                retries=RETRY_CONNECT,
+                limits=httpx.Limits(max_connections=max(1, concurrency)),
+                http2=HTTP2,
+            ),
+        ) as client:
+
+            async def _post(chunk: Tuple[int, bytes]) -> List[Dict]:
+                row_count, content = chunk
+                # httpx only retries failed connections, so retryable status
+                # codes are handled here, without holding the semaphore
+                # while waiting.
+                for attempt in range(RETRY_TOTAL + 1):
+                    async with semaphore:
+                        response = await client.post(
+                            batch_address_url,
+                            content=content,
+                        )
+                    if (
+                        response.status_code not in RETRY_STATUSES
+                        or attempt == RETRY_TOTAL
+                    ):
+                        break
+                    await asyncio.sleep(
+                        retry_delay(attempt, response.headers.get("Retry-After"))
+                    )
+                response_list = FastOpenData.read_response(response)
+                if on_response is not None:
+                    on_response(row_count)
+                return response_list
+
+            responses = await asyncio.gather(*(_post(chunk) for chunk in chunks))
+        return [
+            response_dict for response in responses for response_dict in response
+        ]
+
+    @staticmethod
+    def check_csv_parameters(
+        input_csv: str = "",
+        output_csv: str = "",
+        free_form_query_column: Optional[str] = None,
+    ) -> bool:
+        """
+        Check that the CSV parameters are valid before any work is done.
+
+        Args:
+            input_csv: The path of the input CSV file, which must exist.
+            output_csv: The path of the output CSV file, which must not exist.
+            free_form_query_column: The column containing the address.
+
+        Returns:
+            True if the CSV parameters are valid.
+
+        Raises:
+            FastOpenDataClientException: If any of the parameters is invalid.
         """
         if not free_form_query_column:
-            print("Need to specify column containing address information")
-            sys.exit(1)
+            raise FastOpenDataClientException(
+                "Need to specify column containing address information."
+            )
         if not input_csv:
-            print("You must provide the path of a CSV file.")
-            sys.exit(1)
+            raise FastOpenDataClientException(
+                "You must provide the path of a CSV file."
+            )
         if not output_csv:
-            print("You must provide the path for the output CSV.")
-            sys.exit(1)
+            raise FastOpenDataClientException(
+                "You must provide the path for the output CSV."
+            )
         if not os.path.isfile(input_csv):
-            print(f"CSV file {input_csv} does not exist.")
-            sys.exit(1)
+            raise FastOpenDataClientException(f"CSV file {input_csv} does not exist.")
         if os.path.isfile(output_csv):
-            print(f"Output file {output_csv} already exists.")
-            sys.exit(1)
+            raise FastOpenDataClientException(
+                f"Output file {output_csv} already exists."
+            )
+        return True
+
+    @staticmethod
+    def read_csv(input_csv: str) -> Tuple[List[str], Iterator[Dict[str, str]]]:
+        """
+        Read a CSV file as a stream of rows.
 
-        counter = 0
+        If `pyarrow` is installed, its multithreaded streaming reader is used,
+        with every column read as a string so that values such as zip codes
+        are passed through unchanged. Otherwise the stdlib `csv` module is used.
 
-        def _write_batch(_writer, _batch: List[dict]) -> None:
+        Both readers give the same column names and rows: the file is read as
+        UTF-8 with any byte order mark removed, and if `pyarrow` rejects a row
+        that `csv.DictReader` accepts (such as a row with a missing field),
+        reading carries on with `csv.DictReader` from that point.
+
+        Args:
+            input_csv: The path of the CSV file.
+
+        Returns:
+            The list of column names and an iterator over the rows as
+            dictionaries.
+        """
+
+        def _stdlib_rows(skip: int = 0) -> Iterator[Dict[str, str]]:
+            with open(
+                input_csv,
+                "r",
+                newline="",
+                encoding="utf-8-sig",
+                buffering=CSV_BUFFER_SIZE,
+            ) as f:
+                yield from islice(DictReader(f), skip, None)
+
+        with open(input_csv, "r", newline="", encoding="utf-8-sig") as f:
+            fieldnames = next(csv_reader(f), [])
+        if not fieldnames:
+            return fieldnames, _stdlib_rows()
+        # pyarrow takes a while to import, so it is only loaded when a CSV
+        # file is actually read.
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            return fieldnames, _stdlib_rows()
+        try:
+            record_batch_reader = pa_csv.open_csv(
+                input_csv,
+                read_options=pa_csv.ReadOptions(block_size=CSV_BUFFER_SIZE),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={column: pa.string() for column in fieldnames},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+        except pa.ArrowInvalid:
+            return fieldnames, _stdlib_rows()
+
+        def _pyarrow_rows() -> Iterator[Dict[str, str]]:
+            row_count = 0
+            with record_batch_reader:
+                try:
+                    for record_batch in record_batch_reader:
+                        rows = record_batch.to_pylist()
+                        row_count += len(rows)
+                        yield from rows
+                    return
+                except pa.ArrowInvalid:
+                    pass
+            yield from _stdlib_rows(skip=row_count)
+
+        return record_batch_reader.schema.names, _pyarrow_rows()
+
+    def append_to_csv(
+        self,
+        input_csv: str = "",
+        output_csv: str = "",
+        free_form_query_column: Optional[str] = None,
+        address1_column: Optional[str] = None,
+        address2_column: Optional[str] = None,
+        city_column: Optional[str] = None,
+        state_column: Optional[str] = None,
+        zip_code_column: Optional[str] = None,
+        batch_size: Optional[int] = BATCH_SIZE,
+        concurrency: Optional[int] = CONCURRENCY,
+    ):
+        """
+        Append data from FastOpenData to an existing CSV file.
+
+        Batches are sent to the server from a pool of `concurrency` threads
+        and written to `output_csv` in the same order as `input_csv`.
+        """
+        FastOpenData.check_csv_parameters(
+            input_csv=input_csv,
+            output_csv=output_csv,
+            free_form_query_column=free_form_query_column,
+        )
+
+        def _fetch_batch(_batch: List[dict]) -> List[dict]:
             '''
-            Private method to write a batch of rows to the CSV file.
+            Private method to get the flattened responses for a batch of rows.
             '''
             batch_response = self.send_batch(
                 _batch,
@@ -526,35 +1380,59 @@ class FastOpenData:
                 batch_size=batch_size,
                 progress_bar=False,
             )
-            batch_response = FastOpenData.flatten_response_list(batch_response)
-            for index, response in enumerate(batch_response):
-                response.update(_batch[index])
-                _writer.writerow(response)
-        csv_file = open(input_csv, "r")
-        for index, _ in enumerate(csv_file):
-            pass
-        total_batch_size = index
-        csv_file.close()
-        with open(output_csv, "w") as o:
-            with open(input_csv, "r") as f:
-                with Progress(transient=True, expand=False) as pbar:
-                    task = pbar.add_task("Appending", total=total_batch_size)
-                    reader = DictReader(f)
-                    input_csv_column_list = reader.fieldnames
+            return FastOpenData.flatten_response_list(batch_response)
+
+        def _write_batch(_writer, _batch: List[dict], _future: Future) -> int:
+            '''
+            Private method to write a batch of rows to the CSV file. Returns
+            the number of rows written.
+            '''
+            batch_response = _future.result()
+            for response, row in zip(batch_response, _batch):
+                response.update(row)
+            _writer.writerows(batch_response)
+            return len(_batch)
+        # Bound the number of batches in flight so memory use stays flat.
+        pending: Deque[Tuple[List[dict], Future]] = deque()
+        max_pending = max(1, concurrency) * 2
+        input_csv_column_list, reader = FastOpenData.read_csv(input_csv)
+        FastOpenData.check_address_columns(
+            (
+                free_form_query_column,
+                address1_column,
+                address2_column,
+                city_column,
+                state_column,
+                zip_code_column,
+            ),
+            input_csv_column_list,
+            f"CSV file {input_csv}",
+        )
+        with open(output_csv, "w", newline="", buffering=CSV_BUFFER_SIZE) as o:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                with Progress(
+                    transient=True, expand=False, refresh_per_second=2
+                ) as pbar:
+                    # The row count isn't known without reading the file
+                    # twice, so the progress bar is indeterminate.
+                    task = pbar.add_task("Appending", total=None)
                     writer = DictWriter(
-                        o, fieldnames=self.geography_columns_list + input_csv_column_list
+                        o,
+                        fieldnames=self.geography_columns_list + input_csv_column_list,
                     )
                     writer.writeheader()
                     batch = []
                     for row in reader:
-                        counter += 1
-                        pbar.advance(task, 1)
                         batch.append(row)
-                        if len(batch) == 10:
-                            _write_batch(writer, batch)
+                        if len(batch) >= batch_size:
+                            pending.append((batch, executor.submit(_fetch_batch, batch)))
                             batch = []
-            if batch:
-                _write_batch(writer, batch)
+                            if len(pending) >= max_pending:
+                                pbar.advance(task, _write_batch(writer, *pending.popleft()))
+                    if batch:
+                        pending.append((batch, executor.submit(_fetch_batch, batch)))
+                    while pending:
+                        pbar.advance(task, _write_batch(writer, *pending.popleft()))
 
 
 def main():
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+import pytest
+
+from fastopendata_client import cli_entry
+
+
+def test_csv_rejects_non_integer_batch_size(capsysbinary):
+    with pytest.raises(SystemExit) as excinfo:
+        cli_entry._fast_main(["csv", "--api-key", "key", "--batch-size", "abc"])
+    assert excinfo.value.code == 2
+    assert b"'--batch-size': 'abc' is not a valid integer" in capsysbinary.readouterr().err
+
+
+@pytest.mark.parametrize("value", ["0", "-4"])
+def test_csv_rejects_batch_size_below_one(capsysbinary, value):
+    with pytest.raises(SystemExit) as excinfo:
+        cli_entry._fast_main(["csv", "--api-key", "key", "--batch-size", value])
+    assert excinfo.value.code == 2
+    assert b"is not in the range x>=1" in capsysbinary.readouterr().err
+
+
+def test_write_stdout_without_file_descriptor(capsysbinary):
+    cli_entry.write_stdout(b'{"a":1}\n')
+    assert capsysbinary.readouterr().out == b'{"a":1}\n'
+
+
+def test_csv_reports_missing_column(tmp_path, capsysbinary):
+    input_csv = tmp_path / "input.csv"
+    input_csv.write_text("address\n1 Main St\n")
+    output_csv = tmp_path / "output.csv"
+    with pytest.raises(SystemExit) as excinfo:
+        cli_entry._fast_main(
+            [
+                "csv",
+                "--api-key",
+                "key",
+                "--input-csv",
+                str(input_csv),
+                "--output-csv",
+                str(output_csv),
+                "--free-form-query",
+                "adress",
+            ]
+        )
+    assert excinfo.value.code == 1
+    assert b"`adress`" in capsysbinary.readouterr().err
+    assert not output_csv.exists()
+
+
+def test_csv_reports_missing_input_file(tmp_path, capsysbinary):
+    input_csv = tmp_path / "input.csv"
+    with pytest.raises(SystemExit) as excinfo:
+        cli_entry._fast_main(
+            [
+                "csv",
+                "--api-key",
+                "key",
+                "--input-csv",
+                str(input_csv),
+                "--output-csv",
+                str(tmp_path / "output.csv"),
+                "--free-form-query",
+                "address",
+            ]
+        )
+    assert excinfo.value.code == 1
+    assert f"CSV file {input_csv} does not exist.".encode() in (
+        capsysbinary.readouterr().err
+    )
+def test_import_does_not_load_httpx():
+    code = "import sys, fastopendata_client.cli_entry; print('httpx' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+    assert output.strip() == "False"
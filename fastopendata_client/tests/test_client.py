@@ -0,0 +1,256 @@
+import gc
+import json
+import socket
+import sys
+import time
+
+import pytest
+import requests
+
+from fastopendata_client import client
+from fastopendata_client.client import FastOpenData
+
+
+def make_response(body, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+class FakeSession:
+    """
+    Stands in for the client's `requests.Session`. The batch endpoint
+    answers each row with its own `free_form_query`.
+    """
+
+    def __init__(self):
+        self.posted = []
+
+    def post(self, url, data=None, **kwargs):
+        batch = json.loads(data)["batch"]
+        self.posted.extend(batch)
+        return make_response(
+            [{"geography": {"query": row.get("free_form_query")}} for row in batch]
+        )
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fod():
+    fod = FastOpenData(api_key="key")
+    fod.session = FakeSession()
+    return fod
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_is_compact(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(client, "orjson", None)
+    assert client.dumps_json({"a": [1, 2], "b": "c"}) == b'{"a":[1,2],"b":"c"}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_writes_nan_and_numpy_values(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(client, "orjson", None)
+    data = {"a": [float("nan"), client.np.int64(3), client.np.float64("nan")]}
+    assert client.dumps_json(data) == b'{"a":[null,3,null]}'
+
+
+@pytest.fixture(params=["pyarrow", "stdlib"])
+def csv_backend(request, monkeypatch):
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow.csv")
+    else:
+        monkeypatch.setitem(sys.modules, "pyarrow.csv", None)
+    return request.param
+
+
+def test_read_csv_strips_byte_order_mark(tmp_path, csv_backend):
+    path = tmp_path / "input.csv"
+    path.write_bytes("﻿addr,zip\n1 Main,01234\n".encode("utf-8"))
+    fieldnames, rows = FastOpenData.read_csv(str(path))
+    assert fieldnames == ["addr", "zip"]
+    assert list(rows) == [{"addr": "1 Main", "zip": "01234"}]
+
+
+def test_read_csv_accepts_ragged_rows(tmp_path, monkeypatch, csv_backend):
+    # A small block size makes pyarrow reach the short row only after it has
+    # already returned some rows.
+    monkeypatch.setattr(client, "CSV_BUFFER_SIZE", 64)
+    lines = [f"{index} Main St,{index:05d}" for index in range(20)] + ["short"]
+    path = tmp_path / "input.csv"
+    path.write_text("addr,zip\n" + "\n".join(lines) + "\n")
+    fieldnames, rows = FastOpenData.read_csv(str(path))
+    assert fieldnames == ["addr", "zip"]
+    rows = list(rows)
+    assert len(rows) == 21
+    assert rows[0] == {"addr": "0 Main St", "zip": "00000"}
+    assert rows[-1] == {"addr": "short", "zip": None}
+
+
+def test_send_batch_sends_each_address_once(fod):
+    batch = [{"q": "a"}, {"q": "b"}, {"q": "a"}]
+    responses = fod.send_batch(batch, free_form_query_column="q", progress_bar=False)
+    assert fod.session.posted == [{"q": "a"}, {"q": "b"}]
+    assert len(responses) == 3
+    assert responses[0] == responses[2]
+    assert responses[0] is not responses[2]
+
+
+def test_send_batch_answers_cached_rows_locally(fod, tmp_path):
+    fod.cache = client.shelve.open(str(tmp_path / "cache"))
+    batch = [{"free_form_query": "a"}, {"free_form_query": "b"}]
+    first = fod.send_batch(
+        batch, free_form_query_column="free_form_query", progress_bar=False
+    )
+    fod.session.posted.clear()
+    second = fod.send_batch(
+        batch, free_form_query_column="free_form_query", progress_bar=False
+    )
+    assert fod.session.posted == []
+    assert second == first
+
+
+def test_unreachable_server_fails_quickly():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    fod = FastOpenData(api_key="key", ip_address="127.0.0.1", port=port, scheme="http")
+    start = time.monotonic()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        fod.request(free_form_query="1 Main St")
+    assert time.monotonic() - start < 5
+
+
+def test_send_batch_answers_blank_rows_locally(fod):
+    batch = [{"q": "a"}, {"q": "  "}, {"q": None}, {"q": float("nan")}]
+    responses = fod.send_batch(batch, free_form_query_column="q", progress_bar=False)
+    assert fod.session.posted == [{"q": "a"}]
+    assert responses[1:] == [FastOpenData.empty_query_response()] * 3
+
+
+def test_append_to_dataframe_answers_missing_strings_locally(fod):
+    df = client.pd.DataFrame(
+        {"free_form_query": client.pd.array(["a", None, " "], dtype="string")}
+    )
+    result = fod.append_to_dataframe(df)
+    assert fod.session.posted == [{"free_form_query": "a"}]
+    assert result["geography.query"].tolist()[0] == "a"
+
+
+def test_send_batch_raises_for_missing_column(fod):
+    with pytest.raises(client.FastOpenDataClientException, match="`adress`"):
+        fod.send_batch([{"q": "a"}], free_form_query_column="adress")
+    assert fod.session.posted == []
+
+
+def test_append_to_dataframe_raises_for_missing_column(fod):
+    df = client.pd.DataFrame({"address": ["1 Main St"]})
+    with pytest.raises(client.FastOpenDataClientException, match="`adress`"):
+        fod.append_to_dataframe(df, free_form_query_column="adress")
+    assert fod.session.posted == []
+
+
+def test_append_to_dataframe_ignores_absent_default_columns(fod):
+    df = client.pd.DataFrame({"free_form_query": ["1 Main St"]}, index=[7])
+    result = fod.append_to_dataframe(df)
+    assert fod.session.posted == [{"free_form_query": "1 Main St"}]
+    assert result.loc[7, "geography.query"] == "1 Main St"
+
+
+def test_append_to_csv_raises_for_missing_column(fod, tmp_path):
+    input_csv = tmp_path / "input.csv"
+    input_csv.write_text("address\n1 Main St\n")
+    output_csv = tmp_path / "output.csv"
+    with pytest.raises(client.FastOpenDataClientException, match="`adress`"):
+        fod.append_to_csv(
+            input_csv=str(input_csv),
+            output_csv=str(output_csv),
+            free_form_query_column="adress",
+        )
+    assert not output_csv.exists()
+    assert fod.session.posted == []
+
+
+def test_send_batch_with_default_columns_sends_every_row(fod):
+    # With no column names there is nothing to deduplicate on, so distinct
+    # rows must not be merged.
+    batch = [{"free_form_query": "a"}, {"free_form_query": "b"}]
+    responses = fod.send_batch(batch, progress_bar=False)
+    assert fod.session.posted == batch
+    assert responses == [
+        {"geography": {"query": "a"}},
+        {"geography": {"query": "b"}},
+    ]
+
+
+def test_send_batch_with_default_columns_skips_cache(fod, tmp_path):
+    fod.cache = client.shelve.open(str(tmp_path / "cache"))
+    fod.send_batch([{"free_form_query": "a"}], progress_bar=False)
+    responses = fod.send_batch([{"free_form_query": "b"}], progress_bar=False)
+    assert responses == [{"geography": {"query": "b"}}]
+
+
+def test_append_to_dataframe_broadcasts_duplicates(fod):
+    df = client.pd.DataFrame({"free_form_query": ["a", "b", "a"]})
+    result = fod.append_to_dataframe(df)
+    assert fod.session.posted == [{"free_form_query": "a"}, {"free_form_query": "b"}]
+    assert result["geography.query"].tolist() == ["a", "b", "a"]
+
+
+def test_read_response_returns_row_errors_with_the_batch():
+    body = [{"detail": "GeographyException"}, {"geography": {"query": "a"}}]
+    assert FastOpenData.read_response(make_response(body)) == body
+
+
+def test_read_response_raises_for_request_errors():
+    with pytest.raises(client.FastOpenDataClientException, match="Authorization"):
+        FastOpenData.read_response(make_response({"detail": "AuthorizationException"}))
+
+
+def test_read_response_raises_when_rate_limited():
+    with pytest.raises(client.FastOpenDataRateLimitException):
+        FastOpenData.read_response(make_response({"error": "slow down"}, 429))
+
+
+def test_read_response_raises_for_non_json_body():
+    response = make_response(None)
+    response._content = b"<html>Bad Gateway</html>"
+    with pytest.raises(client.FastOpenDataClientException, match="ServerError"):
+        FastOpenData.read_response(response)
+
+
+def test_send_chunks_async_reports_each_response(fod, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+
+    def answer(request):
+        batch = json.loads(request.content)["batch"]
+        return httpx.Response(200, json=[{"geography": {}} for row in batch])
+
+    monkeypatch.setattr(
+        httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(answer)
+    )
+    batch = [{"free_form_query": str(i)} for i in range(5)]
+    chunks = list(FastOpenData.chunk_batch(batch, batch_size=2))
+    counts = []
+    responses = client.asyncio.run(
+        fod.send_chunks_async("http://test/batch", chunks, on_response=counts.append)
+    )
+    assert len(responses) == 5
+    assert sorted(counts) == [1, 2, 2]
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_close_after_cache_fails_to_open(tmp_path):
+    with pytest.raises(OSError):
+        FastOpenData(api_key="key", cache_path=str(tmp_path / "missing" / "cache"))
+    # The partly built client is finalized here, which closes it.
+    gc.collect()